@@ -5,30 +5,89 @@ Following the architectural proposal from the Google Doc
 
 import os
 import json
-from abc import ABC, abstractmethod
+import time
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; config I/O falls back to stdlib json
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the kernel falls back to pure Python
+    njit = None
+    prange = range
+
+import pickle
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple, Union
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 
 
 # =============================================================================
 # DOMAIN MODELS
 # =============================================================================
 
-class EmployeeType(Enum):
-    SALARIED = "salaried"
-    HOURLY = "hourly"
-    FREELANCER = "freelancer"
+# IntEnum members compare as native ints and pack directly into the int8
+# numpy columns without a separate name-to-code translation step.
+class EmployeeType(IntEnum):
+    SALARIED = 0
+    HOURLY = 1
+    FREELANCER = 2
+
+
+class Role(IntEnum):
+    INTERN = 0
+    MANAGER = 1
+    VICE_PRESIDENT = 2
+
+
+_SALARIED_CODE = int(EmployeeType.SALARIED)
+_HOURLY_CODE = int(EmployeeType.HOURLY)
+_INTERN_CODE = int(Role.INTERN)
+
+# Precomputed coercion tables for the lowercase strings used in input data,
+# so bulk employee ingestion is a single dict lookup per field.
+_ROLE_BY_STR = {member.name.lower(): member for member in Role}
+_TYPE_BY_STR = {member.name.lower(): member for member in EmployeeType}
+
+
+def _compute_payments(type_codes, role_codes, salaries, rates, hours,
+                      project_totals, cfg):
+    """Numeric payroll kernel over SoA columns.
+
+    ``cfg`` packs ``[salaried_bonus_pct, hourly_threshold, hourly_bonus]``
+    as float64 so the whole function works on plain arrays and scalars,
+    which lets Numba compile it to machine code when available.
+    """
+    n = type_codes.shape[0]
+    base = np.empty(n, dtype=np.float64)
+    bonus = np.zeros(n, dtype=np.float64)
+    for i in prange(n):
+        if type_codes[i] == _SALARIED_CODE:
+            base[i] = salaries[i]
+            if role_codes[i] != _INTERN_CODE:
+                bonus[i] = base[i] * cfg[0]
+        elif type_codes[i] == _HOURLY_CODE:
+            base[i] = rates[i] * hours[i]
+            if role_codes[i] != _INTERN_CODE and hours[i] > cfg[1]:
+                bonus[i] = cfg[2]
+        else:
+            base[i] = project_totals[i]
+    return base, bonus
 
 
-class Role(Enum):
-    INTERN = "intern"
-    MANAGER = "manager"
-    VICE_PRESIDENT = "vice_president"
+if njit is not None:
+    # Each row is independent, so prange lets Numba split the loop across
+    # cores with the GIL released.
+    _compute_payments = njit(parallel=True, cache=True)(_compute_payments)
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Project for freelancer employees."""
     name: str
@@ -36,7 +95,7 @@ class Project:
     delivered: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Employee:
     """Base employee following the domain model specification."""
     name: str
@@ -47,17 +106,22 @@ class Employee:
     hourly_rate: Optional[float] = None
     hours_worked: Optional[int] = None
     projects: List[Project] = field(default_factory=list)
+    delivered_total: float = 0.0
+    delivered_count: int = 0
 
     def add_project(self, project: Project):
         """Add project for freelancer employees."""
         self.projects.append(project)
+        if project.delivered:
+            self.delivered_total += project.amount
+            self.delivered_count += 1
 
     def get_delivered_projects(self) -> List[Project]:
         """Get all delivered projects."""
         return [p for p in self.projects if p.delivered]
 
 
-@dataclass
+@dataclass(slots=True)
 class Freelancer(Employee):
     """Specific freelancer employee type."""
 
@@ -69,13 +133,17 @@ class Freelancer(Employee):
 # STRATEGY PATTERN - Payment Strategies
 # =============================================================================
 
-class PaymentStrategy(ABC):
-    """Abstract strategy for payment calculation."""
+class PaymentStrategy:
+    """Base strategy for payment calculation.
+
+    A plain class rather than an ABC: the factory is the only place
+    strategies are created, so the metaclass machinery would only add
+    per-call overhead on the payment hot path.
+    """
 
-    @abstractmethod
     def calculate_payment(self, employee: Employee) -> float:
         """Calculate payment for employee."""
-        pass
+        raise NotImplementedError
 
 
 class SalariedPayment(PaymentStrategy):
@@ -96,31 +164,27 @@ class FreelancePayment(PaymentStrategy):
     """Payment strategy for freelancer employees."""
 
     def calculate_payment(self, employee: Employee) -> float:
-        delivered_projects = employee.get_delivered_projects()
-        return sum(project.amount for project in delivered_projects)
+        return employee.delivered_total
 
 
 # =============================================================================
 # STRATEGY PATTERN - Vacation Policies
 # =============================================================================
 
-class VacationPolicy(ABC):
-    """Abstract strategy for vacation policies."""
+class VacationPolicy:
+    """Base strategy for vacation policies."""
 
-    @abstractmethod
     def calculate_vacation_days(self, employee: Employee) -> int:
         """Calculate available vacation days."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def can_take_vacation(self, employee: Employee, days: int) -> bool:
         """Check if employee can take vacation days."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def can_payout_vacation(self, employee: Employee, days: int) -> bool:
         """Check if employee can get vacation payout."""
-        pass
+        raise NotImplementedError
 
 
 class BasicVacation(VacationPolicy):
@@ -192,192 +256,393 @@ class HourlyVacation(VacationPolicy):
 # FACTORY PATTERN - Strategy Creation
 # =============================================================================
 
+# Dispatch tables built once at import time so strategy creation is a single
+# hashed lookup on the enum instead of a chain of equality tests. The
+# strategies are stateless, so a single shared instance per type is safe and
+# avoids an allocation per employee per operation.
+_PAYMENT_STRATEGIES = {
+    EmployeeType.SALARIED: SalariedPayment(),
+    EmployeeType.HOURLY: HourlyPayment(),
+    EmployeeType.FREELANCER: FreelancePayment(),
+}
+
+_VACATION_POLICIES_BY_ROLE = {
+    Role.INTERN: InternVacation(),
+    Role.MANAGER: ManagerVacation(),
+    Role.VICE_PRESIDENT: VPVacation(),
+}
+
+_VACATION_POLICIES_BY_TYPE = {
+    EmployeeType.HOURLY: HourlyVacation(),
+}
+
+_BASIC_VACATION = BasicVacation()
+
+
 class StrategyFactory:
     """Factory for creating strategies as specified in the document."""
 
     @staticmethod
     def create_payment_strategy(employee_type: EmployeeType) -> PaymentStrategy:
         """Create payment strategy based on employee type."""
-        if employee_type == EmployeeType.SALARIED:
-            return SalariedPayment()
-        elif employee_type == EmployeeType.HOURLY:
-            return HourlyPayment()
-        elif employee_type == EmployeeType.FREELANCER:
-            return FreelancePayment()
-        else:
+        try:
+            return _PAYMENT_STRATEGIES[employee_type]
+        except KeyError:
             raise ValueError(f"Unknown employee type: {employee_type}")
 
     @staticmethod
     def create_vacation_policy(role: Role, employee_type: EmployeeType) -> VacationPolicy:
         """Create vacation policy based on role and type."""
-        if role == Role.INTERN:
-            return InternVacation()
-        elif role == Role.MANAGER:
-            return ManagerVacation()
-        elif role == Role.VICE_PRESIDENT:
-            return VPVacation()
-        elif employee_type == EmployeeType.HOURLY:
-            return HourlyVacation()
-        else:
-            return BasicVacation()
+        policy = _VACATION_POLICIES_BY_ROLE.get(role)
+        if policy is None:
+            policy = _VACATION_POLICIES_BY_TYPE.get(employee_type, _BASIC_VACATION)
+        return policy
 
 
 # =============================================================================
 # FACTORY PATTERN - Employee Creation
 # =============================================================================
 
+# One small builder per employee type, specialized for the fields that type
+# requires, registered in a dispatch table keyed by EmployeeType. Adding a
+# new type means adding a builder and one table entry.
+def _build_salaried(data: dict, role: Role) -> Employee:
+    return Employee(
+        name=data["name"],
+        role=role,
+        employee_type=EmployeeType.SALARIED,
+        salary=data["salary"]
+    )
+
+
+def _build_hourly(data: dict, role: Role) -> Employee:
+    return Employee(
+        name=data["name"],
+        role=role,
+        employee_type=EmployeeType.HOURLY,
+        hourly_rate=data["hourly_rate"],
+        hours_worked=data["hours_worked"]
+    )
+
+
+def _build_freelancer(data: dict, role: Role) -> Employee:
+    return Freelancer(
+        name=data["name"],
+        role=role,
+        employee_type=EmployeeType.FREELANCER
+    )
+
+
+_BUILDERS = {
+    EmployeeType.SALARIED: _build_salaried,
+    EmployeeType.HOURLY: _build_hourly,
+    EmployeeType.FREELANCER: _build_freelancer,
+}
+
+
 class EmployeeFactory:
     """Factory for creating employees with appropriate strategies."""
 
     @staticmethod
     def create_employee(data: dict) -> Employee:
         """Create employee based on provided data."""
-        name = data["name"]
-        role = Role(data["role"])
-        employee_type = EmployeeType(data["type"])
-
-        if employee_type == EmployeeType.SALARIED:
-            return Employee(
-                name=name,
-                role=role,
-                employee_type=employee_type,
-                salary=data["salary"]
-            )
-        elif employee_type == EmployeeType.HOURLY:
-            return Employee(
-                name=name,
-                role=role,
-                employee_type=employee_type,
-                hourly_rate=data["hourly_rate"],
-                hours_worked=data["hours_worked"]
-            )
-        elif employee_type == EmployeeType.FREELANCER:
-            return Freelancer(
-                name=name,
-                role=role,
-                employee_type=employee_type
-            )
-        else:
-            raise ValueError(f"Unknown employee type: {employee_type}")
+        try:
+            role = _ROLE_BY_STR[data["role"]]
+        except KeyError:
+            raise ValueError(f"Unknown role: {data['role']}")
+        try:
+            builder = _BUILDERS[_TYPE_BY_STR[data["type"]]]
+        except KeyError:
+            raise ValueError(f"Unknown employee type: {data['type']}")
+        return builder(data, role)
 
 
 # =============================================================================
 # OPERATION LOG - Audit System
 # =============================================================================
 
+@dataclass(slots=True)
+class LogEntry:
+    """Single audit log record.
+
+    ``timestamp`` is an integer nanosecond epoch from ``time.time_ns()``;
+    it is only converted to a datetime when the history view formats it.
+    Payment entries store ``details`` as a raw ``(base, bonus)`` tuple so
+    the hot path skips string formatting; ``format_details`` renders it
+    when the history is actually displayed.
+    """
+    timestamp: int
+    operation: str
+    employee_name: Optional[str]
+    amount: Optional[float]
+    details: Union[str, Tuple[float, float], None]
+
+
+def format_details(entry: LogEntry) -> str:
+    """Render a log entry's details for display."""
+    details = entry.details
+    if isinstance(details, tuple):
+        base, bonus = details
+        text = f"Base: ${base:.2f}"
+        if bonus > 0:
+            text += f", Bonus: ${bonus:.2f}"
+        return text
+    return details
+
+
 class OperationLog:
-    """Centralized operation logging system as specified."""
+    """Centralized operation logging system as specified.
+
+    Entries are stored column-wise in parallel numpy arrays (timestamps,
+    operation codes, employee ids, amounts) plus a plain list for the
+    heterogeneous details field. Operation names and employee names are
+    interned into small code tables, so a record costs four scalar array
+    writes and filtered or aggregate queries run as vectorized masks over
+    the columns. LogEntry objects are only materialized for the UI. Once
+    the buffer fills, the columns are flushed to an on-disk pickle file;
+    queries unpickle each flushed batch at most once, caching it with a
+    per-employee index for later calls.
+    """
+
+    _MAX_BUFFERED = 100_000
+    _FLUSH_FILE = "operation_log.pkl"
+    _INITIAL_CAPACITY = 1024
+
+    _size = 0
+    _timestamps = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+    _op_codes = np.zeros(_INITIAL_CAPACITY, dtype=np.int8)
+    _employee_ids = np.zeros(_INITIAL_CAPACITY, dtype=np.int32)
+    _amounts = np.zeros(_INITIAL_CAPACITY, dtype=np.float64)
+    _details: List[Union[str, Tuple[float, float], None]] = []
+
+    _op_code_of: Dict[str, int] = {}
+    _op_names: List[str] = []
+    _id_of_employee: Dict[str, int] = {}
+    _employee_names: List[str] = []
+
+    # Cache over the append-only overflow file: batches are unpickled at
+    # most once, indexed by employee as they load, and later syncs only
+    # read bytes past _flush_read_offset.
+    _flushed_entries: List[LogEntry] = []
+    _flushed_by_employee: Dict[str, List[LogEntry]] = defaultdict(list)
+    _flush_read_offset = 0
 
-    _operations: List[Dict[str, Any]] = []
+    @classmethod
+    def _grow_columns(cls):
+        """Double column capacity when the next row would not fit."""
+        new_capacity = len(cls._timestamps) * 2
+        for name in ("_timestamps", "_op_codes", "_employee_ids", "_amounts"):
+            column = getattr(cls, name)
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[:cls._size] = column[:cls._size]
+            setattr(cls, name, grown)
 
     @classmethod
-    def record(cls, operation: str, employee_name: str = None, amount: float = None, details: str = None):
+    def _intern_operation(cls, operation: str) -> int:
+        code = cls._op_code_of.get(operation)
+        if code is None:
+            code = len(cls._op_names)
+            cls._op_code_of[operation] = code
+            cls._op_names.append(operation)
+        return code
+
+    @classmethod
+    def _intern_employee(cls, employee_name: Optional[str]) -> int:
+        if employee_name is None:
+            return -1
+        emp_id = cls._id_of_employee.get(employee_name)
+        if emp_id is None:
+            emp_id = len(cls._employee_names)
+            cls._id_of_employee[employee_name] = emp_id
+            cls._employee_names.append(employee_name)
+        return emp_id
+
+    @classmethod
+    def record(cls, operation: str, employee_name: str = None, amount: float = None,
+               details: Union[str, Tuple[float, float], None] = None):
         """Record an operation in the audit log."""
-        log_entry = {
-            "timestamp": datetime.now(),
-            "operation": operation,
-            "employee_name": employee_name,
-            "amount": amount,
-            "details": details
-        }
-        cls._operations.append(log_entry)
+        if cls._size == len(cls._timestamps):
+            cls._grow_columns()
+        row = cls._size
+        cls._timestamps[row] = time.time_ns()
+        cls._op_codes[row] = cls._intern_operation(operation)
+        cls._employee_ids[row] = cls._intern_employee(employee_name)
+        cls._amounts[row] = np.nan if amount is None else amount
+        cls._details.append(details)
+        cls._size += 1
+        if cls._size >= cls._MAX_BUFFERED:
+            cls.flush_to_disk()
+
+    @classmethod
+    def _materialize(cls, rows) -> List[LogEntry]:
+        """Build LogEntry objects for the given row indexes (UI only)."""
+        entries = []
+        for row in rows:
+            amount = cls._amounts[row]
+            emp_id = cls._employee_ids[row]
+            entries.append(LogEntry(
+                timestamp=int(cls._timestamps[row]),
+                operation=cls._op_names[cls._op_codes[row]],
+                employee_name=None if emp_id < 0 else cls._employee_names[emp_id],
+                amount=None if np.isnan(amount) else float(amount),
+                details=cls._details[row]
+            ))
+        return entries
+
+    @classmethod
+    def _cache_flushed_batch(cls, entries: List[LogEntry]):
+        """Add a flushed batch to the cache and its per-employee index."""
+        cls._flushed_entries.extend(entries)
+        for entry in entries:
+            if entry.employee_name is not None:
+                cls._flushed_by_employee[entry.employee_name].append(entry)
+
+    @classmethod
+    def _sync_flushed(cls):
+        """Read any overflow-file batches not yet in the cache.
+
+        The file is append-only, so only the bytes past the last read
+        offset are unpickled; repeated queries cost nothing once the
+        cache is up to date.
+        """
+        try:
+            with open(cls._FLUSH_FILE, 'rb') as f:
+                f.seek(cls._flush_read_offset)
+                while True:
+                    try:
+                        cls._cache_flushed_batch(pickle.load(f))
+                    except EOFError:
+                        break
+                cls._flush_read_offset = f.tell()
+        except FileNotFoundError:
+            pass
 
     @classmethod
-    def get_operations(cls, employee_name: str = None) -> List[Dict[str, Any]]:
+    def flush_to_disk(cls):
+        """Append the buffered entries to the on-disk log and clear them."""
+        if cls._size == 0:
+            return
+        cls._sync_flushed()
+        entries = cls._materialize(range(cls._size))
+        with open(cls._FLUSH_FILE, 'ab') as f:
+            pickle.dump(entries, f)
+            cls._flush_read_offset = f.tell()
+        cls._cache_flushed_batch(entries)
+        cls._size = 0
+        cls._details.clear()
+
+    @classmethod
+    def get_operations(cls, employee_name: str = None) -> List[LogEntry]:
         """Get operations, optionally filtered by employee."""
+        cls._sync_flushed()
         if employee_name:
-            return [op for op in cls._operations if op["employee_name"] == employee_name]
-        return cls._operations.copy()
+            flushed = cls._flushed_by_employee.get(employee_name, [])
+            emp_id = cls._id_of_employee.get(employee_name)
+            if emp_id is None:
+                return flushed.copy()
+            mask = cls._employee_ids[:cls._size] == emp_id
+            return flushed + cls._materialize(np.nonzero(mask)[0])
+        return cls._flushed_entries + cls._materialize(range(cls._size))
+
+    @classmethod
+    def total_amount(cls, employee_name: str, operation: str = "PAYMENT") -> float:
+        """Sum the amounts recorded for an employee.
+
+        Buffered rows are summed with a vectorized mask over the columns;
+        entries already flushed to disk are included via the flush cache.
+        """
+        cls._sync_flushed()
+        total = sum(entry.amount
+                    for entry in cls._flushed_by_employee.get(employee_name, ())
+                    if entry.operation == operation and entry.amount is not None)
+        emp_id = cls._id_of_employee.get(employee_name)
+        op_code = cls._op_code_of.get(operation)
+        if emp_id is not None and op_code is not None:
+            mask = ((cls._employee_ids[:cls._size] == emp_id)
+                    & (cls._op_codes[:cls._size] == op_code))
+            total += np.nansum(cls._amounts[:cls._size][mask])
+        return float(total)
 
     @classmethod
     def clear_log(cls):
         """Clear all operations (for testing)."""
-        cls._operations.clear()
+        cls._size = 0
+        cls._details.clear()
+        cls._op_code_of.clear()
+        cls._op_names.clear()
+        cls._id_of_employee.clear()
+        cls._employee_names.clear()
+        cls._flushed_entries.clear()
+        cls._flushed_by_employee.clear()
+        cls._flush_read_offset = 0
+        try:
+            os.remove(cls._FLUSH_FILE)
+        except FileNotFoundError:
+            pass
 
 
 # =============================================================================
-# COMMAND PATTERN - Operations with Audit
+# AUDITED OPERATIONS
 # =============================================================================
 
-class PayEmployeeCommand:
-    """Command to pay an employee with audit logging."""
-
-    def __init__(self, employee: Employee, payment_strategy: PaymentStrategy, config: Dict[str, Any]):
-        self.employee = employee
-        self.payment_strategy = payment_strategy
-        self.config = config
-
-    def execute(self) -> float:
-        """Execute payment and log operation."""
-        base_payment = self.payment_strategy.calculate_payment(self.employee)
-        bonus = self._calculate_bonus(base_payment)
-        total_payment = base_payment + bonus
-
-        details = f"Base: ${base_payment:.2f}"
-        if bonus > 0:
-            details += f", Bonus: ${bonus:.2f}"
+def pay_employee(employee: Employee, payment_strategy: PaymentStrategy,
+                 salaried_pct: float, hourly_threshold: float,
+                 hourly_bonus: float) -> float:
+    """Pay a single employee and log the operation.
+
+    The bonus parameters are resolved once by the caller so a payroll run
+    over N employees does not repeat the config dict lookups N times.
+    """
+    base_payment = payment_strategy.calculate_payment(employee)
+
+    bonus = 0.0
+    if employee.role != Role.INTERN:
+        if employee.employee_type == EmployeeType.SALARIED:
+            bonus = base_payment * salaried_pct
+        elif employee.employee_type == EmployeeType.HOURLY:
+            if employee.hours_worked > hourly_threshold:
+                bonus = hourly_bonus
+    total_payment = base_payment + bonus
+
+    OperationLog.record(
+        operation="PAYMENT",
+        employee_name=employee.name,
+        amount=total_payment,
+        details=(base_payment, bonus)
+    )
+
+    return total_payment
+
+
+def grant_vacation(employee: Employee, vacation_policy: VacationPolicy,
+                   days: int, payout: bool = False):
+    """Grant vacation (or payout) to an employee and log the operation."""
+    if payout:
+        if not vacation_policy.can_payout_vacation(employee, days):
+            raise ValueError(f"Cannot payout {days} vacation days for {employee.name}")
+
+        if employee.role != Role.VICE_PRESIDENT:
+            employee.vacation_days -= days
 
         OperationLog.record(
-            operation="PAYMENT",
-            employee_name=self.employee.name,
-            amount=total_payment,
-            details=details
+            operation="VACATION_PAYOUT",
+            employee_name=employee.name,
+            amount=days,
+            details=f"Paid out {days} vacation days"
         )
+    else:
+        if not vacation_policy.can_take_vacation(employee, days):
+            raise ValueError(f"Cannot take {days} vacation days for {employee.name}")
 
-        return total_payment
-
-    def _calculate_bonus(self, base_payment: float) -> float:
-        """Calculate performance bonus based on role and type."""
-        if self.employee.role == Role.INTERN:
-            return 0.0
-
-        if self.employee.employee_type == EmployeeType.SALARIED:
-            return base_payment * self.config.get("salaried_bonus_percentage", 0.1)
-        elif self.employee.employee_type == EmployeeType.HOURLY:
-            threshold = self.config.get("hourly_bonus_threshold", 160)
-            bonus_amount = self.config.get("hourly_bonus_amount", 100)
-            return bonus_amount if self.employee.hours_worked > threshold else 0.0
-
-        return 0.0
-
-
-class GrantVacationCommand:
-    """Command to grant vacation with audit logging."""
-
-    def __init__(self, employee: Employee, vacation_policy: VacationPolicy, days: int, payout: bool = False):
-        self.employee = employee
-        self.vacation_policy = vacation_policy
-        self.days = days
-        self.payout = payout
-
-    def execute(self):
-        """Execute vacation grant and log operation."""
-        if self.payout:
-            if not self.vacation_policy.can_payout_vacation(self.employee, self.days):
-                raise ValueError(f"Cannot payout {self.days} vacation days for {self.employee.name}")
-
-            if self.employee.role != Role.VICE_PRESIDENT:
-                self.employee.vacation_days -= self.days
-
-            OperationLog.record(
-                operation="VACATION_PAYOUT",
-                employee_name=self.employee.name,
-                amount=self.days,
-                details=f"Paid out {self.days} vacation days"
-            )
-        else:
-            if not self.vacation_policy.can_take_vacation(self.employee, self.days):
-                raise ValueError(f"Cannot take {self.days} vacation days for {self.employee.name}")
-
-            if self.employee.role != Role.VICE_PRESIDENT:
-                self.employee.vacation_days -= self.days
+        if employee.role != Role.VICE_PRESIDENT:
+            employee.vacation_days -= days
 
-            OperationLog.record(
-                operation="VACATION_TAKEN",
-                employee_name=self.employee.name,
-                amount=self.days,
-                details=f"Took {self.days} vacation days"
-            )
+        OperationLog.record(
+            operation="VACATION_TAKEN",
+            employee_name=employee.name,
+            amount=days,
+            details=f"Took {days} vacation days"
+        )
 
 
 # =============================================================================
@@ -390,17 +655,62 @@ class PayrollService:
     def __init__(self, config_manager):
         self.config_manager = config_manager
 
+    def _bonus_parameters(self) -> tuple:
+        """Resolve the bonus config values once for a payroll run."""
+        config = self.config_manager.get_config()
+        return (config.get("salaried_bonus_percentage", 0.1),
+                config.get("hourly_bonus_threshold", 160),
+                config.get("hourly_bonus_amount", 100))
+
     def pay_employee(self, employee: Employee) -> float:
         """Pay an employee using strategy pattern."""
         payment_strategy = StrategyFactory.create_payment_strategy(employee.employee_type)
-        command = PayEmployeeCommand(employee, payment_strategy, self.config_manager.get_config())
-        return command.execute()
+        salaried_pct, hourly_threshold, hourly_bonus = self._bonus_parameters()
+        return pay_employee(employee, payment_strategy,
+                            salaried_pct, hourly_threshold, hourly_bonus)
 
     def pay_all_employees(self, employees: List[Employee]) -> Dict[str, float]:
         """Pay all employees and return payment summary."""
+        salaried_pct, hourly_threshold, hourly_bonus = self._bonus_parameters()
         payments = {}
         for employee in employees:
-            payments[employee.name] = self.pay_employee(employee)
+            payment_strategy = StrategyFactory.create_payment_strategy(employee.employee_type)
+            payments[employee.name] = pay_employee(
+                employee, payment_strategy,
+                salaried_pct, hourly_threshold, hourly_bonus)
+        return payments
+
+    def pay_all_vectorized(self, company: "Company") -> Dict[str, float]:
+        """Pay every employee in one pass over the company's SoA columns.
+
+        Computes base pay and bonus for all employees with a handful of
+        numpy operations instead of one strategy dispatch per employee,
+        then records the same audit entries as the per-employee path.
+        """
+        n = company._size
+        type_codes = company._type_codes[:n]
+        role_codes = company._role_codes[:n]
+        salaries = company._salaries[:n]
+        rates = company._hourly_rates[:n]
+        hours = company._hours_worked[:n]
+        project_totals = company._project_totals[:n]
+
+        cfg = np.array(self._bonus_parameters(), dtype=np.float64)
+
+        base, bonus = _compute_payments(type_codes, role_codes, salaries,
+                                        rates, hours, project_totals, cfg)
+        totals = base + bonus
+
+        payments = {}
+        for employee, base_payment, bonus_amount, total in zip(
+                company.employees, base.tolist(), bonus.tolist(), totals.tolist()):
+            OperationLog.record(
+                operation="PAYMENT",
+                employee_name=employee.name,
+                amount=total,
+                details=(base_payment, bonus_amount)
+            )
+            payments[employee.name] = total
         return payments
 
 
@@ -410,8 +720,7 @@ class VacationService:
     def grant_vacation(self, employee: Employee, days: int, payout: bool = False):
         """Grant vacation to employee."""
         vacation_policy = StrategyFactory.create_vacation_policy(employee.role, employee.employee_type)
-        command = GrantVacationCommand(employee, vacation_policy, days, payout)
-        command.execute()
+        grant_vacation(employee, vacation_policy, days, payout)
 
 
 # =============================================================================
@@ -430,24 +739,32 @@ class ConfigurationManager:
     def __init__(self, config_file: str = "payroll_config.json"):
         self.config_file = config_file
         self._config = self._load_config()
+        self._view = MappingProxyType(self._config)
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or use defaults."""
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            with open(self.config_file, 'rb') as f:
+                data = f.read()
         except FileNotFoundError:
             return self.DEFAULT_CONFIG.copy()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
 
-    def get_config(self) -> Dict[str, Any]:
-        """Get current configuration."""
-        return self._config.copy()
+    def get_config(self) -> Mapping[str, Any]:
+        """Get a read-only view of the current configuration."""
+        return self._view
 
     def update_config(self, updates: Dict[str, Any]):
         """Update configuration and save to file."""
         self._config.update(updates)
-        with open(self.config_file, 'w') as f:
-            json.dump(self._config, f, indent=2)
+        if orjson is not None:
+            serialized = orjson.dumps(self._config, option=orjson.OPT_INDENT_2)
+        else:
+            serialized = json.dumps(self._config, indent=2).encode()
+        with open(self.config_file, 'wb') as f:
+            f.write(serialized)
 
 
 # =============================================================================
@@ -457,29 +774,67 @@ class ConfigurationManager:
 class Company:
     """Main company class with separated responsibilities."""
 
+    _INITIAL_CAPACITY = 16
+
     def __init__(self):
         self.employees: List[Employee] = []
+        self._by_role: Dict[Role, List[Employee]] = defaultdict(list)
+        self._by_type: Dict[EmployeeType, List[Employee]] = defaultdict(list)
+        # Structure-of-arrays mirror of the employee list: one row per
+        # employee, kept in insertion order so row i matches employees[i].
+        # These columns feed the vectorized payroll path.
+        self._size = 0
+        self._type_codes = np.zeros(self._INITIAL_CAPACITY, dtype=np.int8)
+        self._role_codes = np.zeros(self._INITIAL_CAPACITY, dtype=np.int8)
+        self._salaries = np.zeros(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._hourly_rates = np.zeros(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._hours_worked = np.zeros(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._project_totals = np.zeros(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._row_of: Dict[int, int] = {}
         self.config_manager = ConfigurationManager()
         self.payroll_service = PayrollService(self.config_manager)
         self.vacation_service = VacationService()
 
+    def _grow_columns(self):
+        """Double column capacity when the next row would not fit."""
+        new_capacity = len(self._type_codes) * 2
+        for name in ("_type_codes", "_role_codes", "_salaries",
+                     "_hourly_rates", "_hours_worked", "_project_totals"):
+            column = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
     def add_employee(self, employee_data: Dict[str, Any]) -> Employee:
         """Add employee to company."""
         employee = EmployeeFactory.create_employee(employee_data)
         self.employees.append(employee)
+        self._by_role[employee.role].append(employee)
+        self._by_type[employee.employee_type].append(employee)
+
+        if self._size == len(self._type_codes):
+            self._grow_columns()
+        row = self._size
+        self._type_codes[row] = int(employee.employee_type)
+        self._role_codes[row] = int(employee.role)
+        self._salaries[row] = employee.salary or 0.0
+        self._hourly_rates[row] = employee.hourly_rate or 0.0
+        self._hours_worked[row] = employee.hours_worked or 0
+        self._row_of[id(employee)] = row
+        self._size += 1
         return employee
 
     def find_employees_by_role(self, role: Role) -> List[Employee]:
         """Find employees by role using unified method."""
-        return [emp for emp in self.employees if emp.role == role]
+        return self._by_role.get(role, [])
 
     def find_employees_by_type(self, employee_type: EmployeeType) -> List[Employee]:
         """Find employees by type."""
-        return [emp for emp in self.employees if emp.employee_type == employee_type]
+        return self._by_type.get(employee_type, [])
 
     def pay_all_employees(self) -> Dict[str, float]:
         """Pay all employees using payroll service."""
-        return self.payroll_service.pay_all_employees(self.employees)
+        return self.payroll_service.pay_all_vectorized(self)
 
     def grant_vacation_to_employee(self, employee: Employee, days: int, payout: bool = False):
         """Grant vacation using vacation service."""
@@ -492,8 +847,9 @@ class Company:
 
         project = Project(name=project_name, amount=amount, delivered=True)
         employee.add_project(project)
+        self._project_totals[self._row_of[id(employee)]] += amount
 
-    def get_employee_history(self, employee: Employee) -> List[Dict[str, Any]]:
+    def get_employee_history(self, employee: Employee) -> List[LogEntry]:
         """Get operation history for employee."""
         return OperationLog.get_operations(employee.name)
 
@@ -505,12 +861,14 @@ class Company:
 class EmployeeManagementUI:
     """Presentation layer completely separated from business logic."""
 
+    _CLEAR_CMD = 'cls' if os.name == 'nt' else 'clear'
+
     def __init__(self):
         self.company = Company()
 
     def clear_screen(self):
         """Clear console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        os.system(self._CLEAR_CMD)
 
     def display_menu(self):
         """Display main menu."""
@@ -596,10 +954,9 @@ class EmployeeManagementUI:
             return
 
         for emp in employees:
-            print(f"{emp.name} ({emp.role.value}) - {emp.employee_type.value} - {emp.vacation_days} vacation days")
+            print(f"{emp.name} ({emp.role.name.lower()}) - {emp.employee_type.name.lower()} - {emp.vacation_days} vacation days")
             if emp.employee_type == EmployeeType.FREELANCER:
-                delivered_projects = emp.get_delivered_projects()
-                print(f"  Projects: {len(delivered_projects)}, Total value: ${sum(p.amount for p in delivered_projects):.2f}")
+                print(f"  Projects: {emp.delivered_count}, Total value: ${emp.delivered_total:.2f}")
 
     def grant_vacation_menu(self):
         """Handle vacation granting."""
@@ -610,7 +967,7 @@ class EmployeeManagementUI:
 
         print("Available employees:")
         for idx, emp in enumerate(self.company.employees):
-            print(f"{idx}. {emp.name} ({emp.role.value}) - {emp.vacation_days} vacation days")
+            print(f"{idx}. {emp.name} ({emp.role.name.lower()}) - {emp.vacation_days} vacation days")
 
         try:
             idx = int(input("Select employee index: "))
@@ -686,9 +1043,11 @@ class EmployeeManagementUI:
             else:
                 print(f"\nTransaction history for {employee.name}:")
                 for operation in history:
-                    print(f"{operation['timestamp'].strftime('%Y-%m-%d %H:%M')} - "
-                          f"{operation['operation']} - ${operation['amount']:.2f} - "
-                          f"{operation['details']}")
+                    timestamp = datetime.fromtimestamp(operation.timestamp / 1e9)
+                    print(f"{timestamp.strftime('%Y-%m-%d %H:%M')} - "
+                          f"{operation.operation} - ${operation.amount:.2f} - "
+                          f"{format_details(operation)}")
+                print(f"Total paid: ${OperationLog.total_amount(employee.name):.2f}")
 
         except (IndexError, ValueError) as e:
             print(f"Error: {e}")